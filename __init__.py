@@ -40,6 +40,241 @@ def GetSelectedSculptObject(doc):
     """
 
 
+def SetStencilCacheDirectory(path):
+    """
+    | Sets the directory the subdivision stencil cache is saved to and loaded from.
+    | The stencil cache stores the refinement weights for each base mesh topology, see :meth:`SculptObject.GetTopologyHash`.
+    | Subdividing an object whose topology is already in the cache only applies the cached weights to its points.
+
+    .. versionadded:: 2026.0.0
+
+    :type path: Optional[str]
+    :param path: The directory to use, or **None** to only keep the stencils in memory.
+    """
+
+
+def GetStencilCacheDirectory():
+    """
+    Gets the directory the subdivision stencil cache is saved to.
+
+    .. versionadded:: 2026.0.0
+
+    :rtype: Optional[str]
+    :return: The directory, or **None** if the stencils are only kept in memory.
+    """
+
+
+def ClearStencilCache(clearDisk=False):
+    """
+    Frees all the subdivision stencils held in memory.
+
+    .. versionadded:: 2026.0.0
+
+    :type clearDisk: bool
+    :param clearDisk: Pass **True** to also delete the stencils saved in the directory set with :func:`SetStencilCacheDirectory`.
+    """
+
+
+def EnableBrushProfiling(enable):
+    """
+    | Enables the collection of timings and counters for each brush stroke.
+    | When disabled, which is the default, the dab pipeline does not record anything.
+
+    .. versionadded:: 2026.0.0
+
+    :type enable: bool
+    :param enable: **True** to collect the stroke statistics, otherwise **False**.
+    """
+
+
+def IsBrushProfilingEnabled():
+    """
+    Checks if brush profiling is enabled. See :func:`EnableBrushProfiling`.
+
+    .. versionadded:: 2026.0.0
+
+    :rtype: bool
+    :return: **True** if the stroke statistics are collected, otherwise **False**.
+    """
+
+
+def GetStrokeStats(strokeInstanceId):
+    """
+    | Gets the statistics collected for a brush stroke while brush profiling was enabled.
+    | The statistics of each stroke are kept until :func:`ClearStrokeStats` is called.
+
+    .. versionadded:: 2026.0.0
+
+    :type strokeInstanceId: int
+    :param strokeInstanceId: The ID of the stroke instance, see :meth:`BrushDabData.GetStrokeInstanceID`.
+    :rtype: dict{**dabs**: int, **mirroredDabs**: int, **previewDabs**: int, **points**: int, **times**: dict{str: float}}
+    :return: The stroke statistics, or **None** if nothing was collected for this stroke:
+
+        dabs: The number of dabs.
+        mirroredDabs: The number of mirrored dabs.
+        previewDabs: The number of preview dabs.
+        points: The total number of points touched by all the dabs.
+        times: The time in seconds spent in each phase: *query*, *falloff*, *stamp*, *offset*, *collision* and *display*.
+    """
+
+
+def ClearStrokeStats(strokeInstanceId=None):
+    """
+    Frees the statistics collected by brush profiling.
+
+    .. versionadded:: 2026.0.0
+
+    :type strokeInstanceId: Optional[int]
+    :param strokeInstanceId: The ID of the stroke instance to free the statistics of, or **None** to free the statistics of all the strokes.
+    """
+
+
+def RunBatch(filenames, func, processes=0, memoryLimit=0, timeout=0.0):
+    """
+    | Runs *func* on each sculpt object of each document in *filenames*, spreading the documents across headless worker processes.
+    | Each worker loads one document at a time and calls *func* with every :class:`SculptObject <c4d.modules.sculpting.SculptObject>` found through the :class:`SculptTag <c4d.modules.sculpting.SculptTag>` objects in it.
+    | A worker that raises, runs out of memory or times out only fails its current document, it is then restarted for the next one.
+
+    .. versionadded:: 2026.0.0
+
+    .. code-block:: python
+
+        # my_jobs.py, only holds the job so that the workers can import it.
+        import os
+        import c4d
+
+        def Export(doc, sculptObject):
+            original = sculptObject.GetOriginalObject()
+            name = "{}_{}_{}.c4d".format(os.path.splitext(doc.GetDocumentName())[0], original.GetName(), original.GetGUID())
+            path = os.path.join(doc.GetDocumentPath(), name)
+
+            exportDoc = c4d.documents.BaseDocument()
+            exportDoc.InsertObject(sculptObject.GetPolygonCopy(sculptObject.GetSubdivisionCount(), True))
+            if not c4d.documents.SaveDocument(exportDoc, path, c4d.SAVEDOCUMENTFLAGS_NONE, c4d.FORMAT_C4DEXPORT):
+                raise IOError("Could not write {}".format(path))
+            return path
+
+    .. code-block:: python
+
+        # export_all.py, the driver script.
+        import glob
+        import c4d
+        import my_jobs
+
+        if __name__ == "__main__":
+            files = glob.glob("/assets/heads/*.c4d")
+            for result in c4d.modules.sculpting.RunBatch(files, my_jobs.Export):
+                if result["error"] is not None:
+                    print("{} failed: {}".format(result["filename"], result["error"]))
+
+    .. warning::
+
+        | *func* is called in another process, it must be a module level function that can be imported by the workers.
+        | The workers import the module of *func*, so that module must not call :func:`RunBatch` itself. Call it from a separate script, under ``if __name__ == "__main__":``.
+
+    :type filenames: list of str
+    :param filenames: The paths of the documents to process.
+    :type func: function(doc, sculptObject)
+    :param func: Called for each sculpt object. Its return value must be picklable.
+    :type processes: int
+    :param processes: The number of worker processes. Pass `0` to use one per available core.
+    :type memoryLimit: int
+    :param memoryLimit: The maximum memory in bytes a worker may use for one document, or `0` for no limit.
+    :type timeout: float
+    :param timeout: The maximum time in seconds a worker may spend on one document, or `0.0` for no limit.
+    :rtype: list of dict{**filename**: str, **results**: list, **error**: str}
+    :return: One entry per document, in the order of *filenames*:
+
+        filename: The path of the document.
+        results: The values returned by *func*, one per sculpt object.
+        error: The reason the document failed, or **None** if it succeeded.
+    """
+
+
+def GetSculptMemoryBudget(doc):
+    """
+    Gets the amount of memory all the sculpt objects in *doc* may use together.
+
+    .. versionadded:: 2026.0.0
+
+    :type doc: c4d.documents.BaseDocument
+    :param doc: The document.
+    :rtype: int
+    :return: The budget in bytes, or `0` if there is no budget.
+    """
+
+
+def SetSculptMemoryBudget(doc, budget):
+    """
+    | Sets the amount of memory all the sculpt objects in *doc* may use together, as reported by :meth:`SculptObject.GetMemoryUsage`.
+    | When the budget is exceeded, data that can be rebuilt is freed from the least recently used sculpt objects first, cheapest to rebuild first.
+    | Each kind of data is listed with the name passed to the callback set with :func:`SetSculptMemoryCallback`:
+
+    - *viewbuffer*: The point ID and depth buffers, see :meth:`SculptObject.GetViewBuffer`.
+    - *facing*: The polygon facing flags, see :meth:`SculptObject.GetFacingFlags`.
+    - *symmetry*: The symmetry index maps, see :meth:`SculptObject.GetSymmetryMap`.
+    - *spatialindex*: The spatial index used by :meth:`SculptObject.QueryRadius` and :meth:`SculptObject.QueryKNearest`.
+    - *geodesic*: The heat method factorizations, see :meth:`SculptObject.ComputeGeodesicDistance`.
+    - *stencil*: The subdivision stencils in memory that are only used by sculpt objects of *doc*. Stencils saved to disk are kept, see :func:`SetStencilCacheDirectory`.
+    - *levelcache*: The meshes of the level cache, including the display meshes of the levels that are not currently displayed, see :meth:`SculptObject.SetLevelCacheLimit`.
+    - *composite*: The copy of the composited points, see :meth:`SculptObject.SetIncrementalComposite`. The next layer change recomposites all the layers.
+    - *collision*: The collision data. This is the same as calling :meth:`NeedCollisionUpdate(True) <SculptObject.NeedCollisionUpdate>`, the collision data is rebuilt automatically before the next sculpt tool use, :meth:`SculptObject.HitScreen`, :meth:`SculptObject.HitObject`, :meth:`SculptObject.ComputeCavity` or :meth:`SculptObject.ComputeThickness` call.
+    - *layer*: The data of the inactive layers, which is offloaded to disk, see :meth:`SculptObject.SetLayerMemoryBudget`.
+
+    | If the document is still over budget once all of the above is freed, the data that cannot be rebuilt, i.e. the layers in use and the levels, is never freed.
+    | Instead the operations that would need more of it fail: :meth:`SculptObject.Subdivide` and :meth:`SculptObject.IncreaseSubdivisionLevel` return **False** and :meth:`SculptObject.AddLayer` returns **None**, the sculpt object being left untouched.
+    | The callback set with :func:`SetSculptMemoryCallback` is then called with the *overbudget* kind.
+
+    .. versionadded:: 2026.0.0
+
+    .. note::
+
+        Nothing is freed from the sculpt object a stroke is being drawn on until the stroke ends.
+
+    :type doc: c4d.documents.BaseDocument
+    :param doc: The document.
+    :type budget: int
+    :param budget: The budget in bytes. Pass `0` to remove the budget.
+    """
+
+
+def GetSculptMemoryStats(doc):
+    """
+    Gets the memory used by all the sculpt objects in *doc*.
+
+    .. versionadded:: 2026.0.0
+
+    :type doc: c4d.documents.BaseDocument
+    :param doc: The document.
+    :rtype: dict{**total**: int, **budget**: int, **objects**: dict{:class:`SculptTag <c4d.modules.sculpting.SculptTag>`: int}, **kinds**: dict{str: int}, **evicted**: int}
+    :return: The memory statistics:
+
+        total: The memory in bytes used by all the sculpt objects, see :meth:`SculptObject.GetMemoryUsage`, plus the *stencil* memory.
+        budget: The budget set with :func:`SetSculptMemoryBudget`.
+        objects: The memory in bytes used by the sculpt object of each :class:`SculptTag <c4d.modules.sculpting.SculptTag>`.
+        kinds: The memory in bytes used by each kind of data that can be freed, see :func:`SetSculptMemoryBudget` for the names.
+        evicted: The total memory in bytes freed to stay within the budget since the document was loaded.
+    """
+
+
+def SetSculptMemoryCallback(doc, callback):
+    """
+    Sets a function called each time data is freed to keep the sculpt objects of *doc* within their budget.
+
+    .. versionadded:: 2026.0.0
+
+    :type doc: c4d.documents.BaseDocument
+    :param doc: The document.
+    :type callback: function(tag, kind, size)
+    :param callback:
+
+        | Called from the main thread with the :class:`SculptTag <c4d.modules.sculpting.SculptTag>` whose data was freed, the *kind* of data and the *size* freed in bytes.
+        | *kind* is one of the names listed in :func:`SetSculptMemoryBudget`. *tag* is **None** for the *stencil* kind, since stencils are shared by all the sculpt objects with the same topology.
+        | For the *overbudget* kind nothing was freed, *tag* is the sculpt object whose operation failed and *size* is the amount of memory in bytes that was missing.
+        | Pass **None** to remove the callback.
+    """
+
+
 class SculptTag(BaseTag):
     """
     | When a :class:`PolygonObject <c4d.PolygonObject>` is made sculptable it will contain a :class:`SculptTag <c4d.modules.sculpting.SculptTag>`.
@@ -90,10 +325,89 @@ class SculptObject(BaseObject):
             | If True includes all the detail from any layers that are above subdivisionLevel.
             | If false includes only the sculpting data for all layers up to and including the subdivisionLevel specified. 
             
+        .. note::
+
+            | When the level cache of the sculpt object is enabled (see :meth:`SetLevelCacheLimit`), the evaluated meshes are kept in it, keyed by *level*, *includeTopLevels* and the current state of the layers.
+            | Repeated calls with unchanged layers then only copy the cached mesh.
+
         :rtype: c4d.PolygonObject
         :return: The :class:`PolygonObject <c4d.PolygonObject>` for the subdivision *level*.
         """
 
+    def GetLevelCacheLimit(self):
+        """
+        Gets the maximum amount of memory the level cache of this sculpt object may use.
+
+        .. versionadded:: 2026.0.0
+
+        :rtype: int
+        :return: The limit in bytes, or `0` if the level cache is disabled.
+        """
+
+    def SetLevelCacheLimit(self, limit):
+        """
+        | Sets the maximum amount of memory the level cache of this sculpt object may use.
+        | The level cache holds the meshes evaluated by :meth:`GetPolygonCopy` and the display meshes built when switching levels with :meth:`IncreaseSubdivisionLevel` and :meth:`DecreaseSubdivisionLevel`.
+        | When the limit is exceeded the least recently used meshes are freed first. A mesh larger than the limit on its own is not cached.
+
+        .. versionadded:: 2026.0.0
+
+        .. note::
+
+            | The cached meshes come on top of the copies returned by :meth:`GetPolygonCopy`, and each sculpt object has its own limit.
+            | Use :func:`SetSculptMemoryBudget` to also bound the level caches of all the sculpt objects of a document together.
+
+        :type limit: int
+        :param limit: The limit in bytes. Pass `0` to disable the level cache and free its meshes. Default is `0`, the level cache is disabled.
+        """
+
+    def ClearLevelCache(self):
+        """
+        Frees all the meshes held in the level cache of this sculpt object.
+
+        .. versionadded:: 2026.0.0
+        """
+
+    def IterPolygonChunks(self, level, includeTopLevels, chunkSize=65536):
+        """
+        | Iterates over the sculpt object at a specific subdivision level in chunks, without building the whole :class:`PolygonObject <c4d.PolygonObject>`.
+        | Each chunk is evaluated directly from the sculpt data when it is requested, so exporters can write it to disk and only ever hold one chunk in memory.
+
+        .. versionadded:: 2026.0.0
+
+        .. note::
+
+            | Each polygon is in exactly one chunk, the points shared by polygons in different chunks are repeated in each of them.
+            | Use the *pointIndices* of each chunk to weld them back together.
+
+        .. code-block:: python
+
+            import numpy
+
+            for chunk in sculptObject.IterPolygonChunks(sculptObject.GetSubdivisionCount(), True):
+                points = numpy.frombuffer(chunk["points"], numpy.float32).reshape(-1, 3)
+                polygons = numpy.frombuffer(chunk["polygons"], numpy.int32).reshape(-1, 4)
+                WriteChunk(chunk["pointIndices"], points, polygons)
+
+        .. note::
+
+            The views of a chunk keep their data alive, they stay valid after the iteration moved on to the next chunk.
+
+        :type level: int
+        :param level: The subdivision level to iterate.
+        :type includeTopLevels: bool
+        :param includeTopLevels: Same as in :meth:`GetPolygonCopy`.
+        :type chunkSize: int
+        :param chunkSize: The maximum number of points in a chunk.
+        :raise ValueError: If *chunkSize* is lower than `4`, the number of points of a single polygon.
+        :rtype: Iterator[dict{**pointIndices**: memoryview, **points**: memoryview, **polygons**: memoryview}]
+        :return: The chunks:
+
+            pointIndices: A read-only view of *int32* values, the index at *level* of each chunk point.
+            points: A read-only view of *float32* values, the x, y and z coordinates of each chunk point.
+            polygons: A read-only view of *int32* values, the a, b, c and d point indices of each chunk polygon, indexing into *points*. For triangles c and d are the same, like in :class:`CPolygon <c4d.CPolygon>`.
+        """
+
     def GetOriginalObject(self):
         """
         Get the original :class:`PolygonObject <c4d.PolygonObject>` that the :class:`SculptTag <c4d.modules.sculpting.SculptTag>` is applied to.
@@ -102,6 +416,17 @@ class SculptObject(BaseObject):
         :return: The original :class:`PolygonObject <c4d.PolygonObject>`.
         """
 
+    def GetTopologyHash(self):
+        """
+        | Gets the hash of the topology of the base mesh, i.e. its point count and polygon indices.
+        | Sculpt objects with the same hash share the same entries in the subdivision stencil cache, see :func:`SetStencilCacheDirectory`.
+
+        .. versionadded:: 2026.0.0
+
+        :rtype: int
+        :return: The topology hash.
+        """
+
     def GetPolygonCount(self):
         """
         Get the number of polygons at the current subdivision level.
@@ -130,10 +455,52 @@ class SculptObject(BaseObject):
         """
         Get the amount of memory currently used for this sculpt object. This does not include any memory used by the Viewport.
 
+        .. versionchanged:: 2026.0.0
+
+            Counts the caches that can be freed by :func:`SetSculptMemoryBudget`.
+
+        .. note::
+
+            | The caches of the sculpt object that can be freed by :func:`SetSculptMemoryBudget` are counted, including the view buffers and facing flags of each viewport.
+            | The shared subdivision stencils (see :func:`SetStencilCacheDirectory`) and the layers that are offloaded to disk (see :meth:`SetLayerMemoryBudget`) are not counted.
+
         :rtype: int
         :return: The memory used in bytes.
         """
 
+    def GetLayerMemoryBudget(self):
+        """
+        Gets the amount of layer data this sculpt object keeps in memory before it starts to offload inactive layers.
+
+        .. versionadded:: 2026.0.0
+
+        :rtype: int
+        :return: The budget in bytes, or `0` if offloading is disabled.
+        """
+
+    def SetLayerMemoryBudget(self, budget):
+        """
+        | Sets the amount of layer data this sculpt object keeps in memory.
+        | When the budget is exceeded the data of the inactive layers is moved to memory-mapped temporary files, least recently used first.
+        | A layer is inactive when it is hidden and not selected, so it does not contribute to the composited points and recompositing never needs its data. Locked but visible layers are always kept in memory.
+        | An offloaded layer is loaded back as soon as it is selected, made visible or its data is read or written, for instance with :meth:`SculptLayerData.GetOffset`, :meth:`SculptLayerData.SetOffset` or :meth:`SculptLayerData.AddOffset`. It can be offloaded again once it is inactive and the budget is exceeded.
+
+        .. versionadded:: 2026.0.0
+
+        :type budget: int
+        :param budget: The budget in bytes. Pass `0` to disable offloading and load all the layers back. Default is `0`, offloading is disabled.
+        """
+
+    def OffloadInactiveLayers(self):
+        """
+        Offloads the data of all inactive layers right away, whatever the budget set with :meth:`SetLayerMemoryBudget`.
+
+        .. versionadded:: 2026.0.0
+
+        :rtype: int
+        :return: The amount of memory freed in bytes.
+        """
+
     def GetCurrentLayer(self):
         """
         Get the currently layer, or folder, selected for this sculpt object.
@@ -146,8 +513,12 @@ class SculptObject(BaseObject):
         """
         Create a new layer on the sculpt object at the current subdivision level.
 
+        .. versionchanged:: 2026.0.0
+
+            Returns **None** if the document memory budget cannot be met.
+
         :rtype: c4d.modules.sculpting.SculptLayer
-        :return: The sculpt layer added.
+        :return: The sculpt layer added, or **None** if the document memory budget cannot be met, see :func:`SetSculptMemoryBudget`.
         """
 
     def AddFolder(self):
@@ -170,9 +541,56 @@ class SculptObject(BaseObject):
         :return: **True** if the layer was deleted, otherwise **False**.
         """
 
-    def Update(self):
+    def Update(self, dirtyPointIndices=None):
+        """
+        Recomposites the layers and updates the sculpt object, fully if *dirtyPointIndices* is **None**, otherwise only for the given points.
+
+        .. versionchanged:: 2026.0.0
+
+            Added the *dirtyPointIndices* parameter.
+
+        .. note::
+
+            | When only a few points were changed with :meth:`SculptLayerData.SetOffset` or :meth:`SculptLayerData.AddOffset`, pass them in *dirtyPointIndices*.
+            | Only these points, the normals around them and the matching ranges of the viewport vertex buffer are then updated.
+
+        :type dirtyPointIndices: Optional[list of int]
+        :param dirtyPointIndices: The indices of the points that changed at the current subdivision level, or **None** to update the whole sculpt object.
+        """
+
+    def GetIncrementalComposite(self):
+        """
+        Check if the composited points are kept so that layer changes can be applied incrementally. See :meth:`SetIncrementalComposite`.
+
+        .. versionadded:: 2026.0.0
+
+        :rtype: bool
+        :return: **True** if incremental compositing is enabled, otherwise **False**.
+        """
+
+    def SetIncrementalComposite(self, state):
         """
-        Recomposites all the layers and updates the sculpt object.
+        | Sets whether a copy of the composited points is kept so that changing the strength, visibility or mask state of a single layer only applies the change of that layer.
+        | This makes interactive layer blending real-time on dense meshes at the cost of one extra copy of the points.
+
+        .. versionadded:: 2026.0.0
+
+        .. note::
+
+            The copy can be freed by the document memory budget, see :func:`SetSculptMemoryBudget`. The next layer change then recomposites all the layers and builds the copy again.
+
+        .. note::
+
+            | Applying changes one after the other adds up rounding errors, so the copy is rebuilt from all the layers regularly:
+
+            - On each full :meth:`Update`, i.e. without *dirtyPointIndices*.
+            - When the user releases a layer strength slider in the Sculpting Layer Manager.
+            - After 64 incremental changes without a full recomposite.
+
+            | A partial :meth:`Update` with *dirtyPointIndices* recomposites those points from all the layers, in the copy as well, so the copy stays consistent with the displayed points.
+
+        :type state: bool
+        :param state: **True** to enable incremental compositing, **False** to free the copy and always recomposite all the layers. Disabled by default.
         """
 
     def GetVertexNormal(self, index):
@@ -210,25 +628,132 @@ class SculptObject(BaseObject):
         :return: The point.
         """
 
-    def Subdivide(self):
+    def QueryRadius(self, center, radius):
+        """
+        Finds all the points within *radius* of *center* at the current subdivision level.
+
+        .. versionadded:: 2026.0.0
+
+        .. note::
+
+            | The query uses a spatial index that is cached on the sculpt object.
+            | It is only rebuilt for the parts of the mesh that changed since the last :meth:`Update`.
+
+        :type center: c4d.Vector
+        :param center: The center of the query in object space.
+        :type radius: float
+        :param radius: The radius of the query in object space.
+        :rtype: list of int
+        :return: The indices of the points found, in no particular order.
+        """
+
+    def QueryRadiusBatch(self, centers, radius):
+        """
+        Same as :meth:`QueryRadius` but for many centers at once. The queries are split across all available threads.
+
+        .. versionadded:: 2026.0.0
+
+        :type centers: list of c4d.Vector
+        :param centers: The centers of the queries in object space.
+        :type radius: float
+        :param radius: The radius of the queries in object space.
+        :rtype: list of list of int
+        :return: The indices of the points found for each center.
+        """
+
+    def QueryKNearest(self, center, k):
+        """
+        Finds the *k* points closest to *center* at the current subdivision level.
+
+        .. versionadded:: 2026.0.0
+
+        .. note::
+
+            The query uses the same spatial index as :meth:`QueryRadius`.
+
+        :type center: c4d.Vector
+        :param center: The center of the query in object space.
+        :type k: int
+        :param k: The number of points to find.
+        :rtype: list of int
+        :return: The indices of the points found, sorted from the closest to the farthest.
+        """
+
+    def QueryKNearestBatch(self, centers, k):
+        """
+        Same as :meth:`QueryKNearest` but for many centers at once. The queries are split across all available threads.
+
+        .. versionadded:: 2026.0.0
+
+        :type centers: list of c4d.Vector
+        :param centers: The centers of the queries in object space.
+        :type k: int
+        :param k: The number of points to find for each center.
+        :rtype: list of list of int
+        :return: The indices of the points found for each center, sorted from the closest to the farthest.
+        """
+
+    def EstimateSubdivision(self):
+        """
+        | Estimates the cost of the next call to :meth:`Subdivide` without doing any work.
+        | Use this to check the memory limit (as specified in the preferences) before subdividing.
+
+        .. versionadded:: 2026.0.0
+
+        :rtype: dict{**points**: int, **polygons**: int, **bytes**: int}
+        :return: The estimate for the next level:
+
+            points: The number of points the new level will have.
+            polygons: The number of polygons the new level will have.
+            bytes: The additional memory in bytes required by the new level, including the Base Object layer data.
+        """
+
+    def Subdivide(self, callback=None):
         """
         Subdivide the sculpt object to the next level.
 
+        .. versionchanged:: 2026.0.0
+
+            Added the *callback* parameter.
+
         .. note::
 
             | This method will only work if the sculpt object is already at the top most level and the memory limit (as specified in the preferences) has not been exceeded and also only if there is enough memory on the user's computer to successfully do the subdivision.
+            | Call :meth:`EstimateSubdivision` first to know how much memory will be needed.
+            | It also fails if the document memory budget cannot be met, see :func:`SetSculptMemoryBudget`.
+
+        .. note::
+
+            | The subdivision is split across all available threads.
+            | If the subdivision is cancelled by *callback* the sculpt object is left untouched at its previous level.
+
+        :type callback: Optional[function(progress)]
+        :param callback:
+
+            | Called regularly from the main thread with the *progress* as a float between 0 and 1.
+            | Return **False** to cancel the subdivision, otherwise **True**.
 
         :rtype: bool
         :return: **True** if the object was successfully subdivided, otherwise **False**.
         """
 
-    def IncreaseSubdivisionLevel(self):
+    def IncreaseSubdivisionLevel(self, callback=None):
         """
         | Increase the subdivision level to the next highest level.
         | If it is already at the top subdivision level then it will do nothing.
 
+        .. versionchanged:: 2026.0.0
+
+            Added the *callback* parameter.
+
+        :type callback: Optional[function(progress)]
+        :param callback:
+
+            | Called regularly from the main thread with the *progress* as a float between 0 and 1.
+            | Return **False** to cancel, the sculpt object then stays at its current level.
+
         :rtype: bool
-        :return: **True** if it was able go up a level, otherwise **False**.
+        :return: **True** if it was able go up a level, otherwise **False**, also when the document memory budget cannot be met (see :func:`SetSculptMemoryBudget`).
         """
 
     def DecreaseSubdivisionLevel(self):
@@ -303,6 +828,31 @@ class SculptObject(BaseObject):
     def UpdateCollision(self):
         """
         Updates any collision data after any changes to the sculpt layer offsets have been made. This is required before you call the :meth:`HitScreen`/:meth:`HitObject` methods.
+
+        .. note::
+
+            If the collision data was freed by the document memory budget (see :func:`SetSculptMemoryBudget`) it is rebuilt automatically by the next :meth:`HitScreen`/:meth:`HitObject` call, there is no need to call this method again.
+        """
+
+    def UpdateCollisionAsync(self):
+        """
+        | Same as :meth:`UpdateCollision` but the collision data is rebuilt on a worker thread and the method returns right away.
+        | Calls to :meth:`HitScreen`/:meth:`HitObject` made before the rebuild is done wait for it to finish, unless the caller passes `allowStale=True` to them.
+
+        .. versionadded:: 2026.0.0
+
+        .. note::
+
+            | Calling :meth:`UpdateCollisionAsync` or :meth:`UpdateCollision` while a rebuild is running restarts it with the latest offsets.
+            | The previous future then resolves to **False**.
+
+        .. warning::
+
+            | The callbacks added with :meth:`Future.add_done_callback() <concurrent.futures.Future.add_done_callback>` run on the worker thread, where the Cinema 4D API must not be called.
+            | Check :meth:`Future.done() <concurrent.futures.Future.done>` from the main thread instead, for instance in a timer or a message.
+
+        :rtype: concurrent.futures.Future
+        :return: A future that resolves to **True** once the collision data is up to date, or **False** if the rebuild was restarted.
         """
 
     def NeedCollisionUpdate(self, fullUpdate):
@@ -313,17 +863,22 @@ class SculptObject(BaseObject):
         :param fullUpdate: Set to **True** to update the full mesh. This is not always required.
         """
 
-    def HitScreen(self, bd, mx, my, backfaces):
+    def HitScreen(self, bd, mx, my, backfaces, allowStale=False, hintPolygon=-1):
         """
         From a viewport cast a ray, in screen space, onto the sculpt object and return any data if the ray hits the object.
 
+        .. versionchanged:: 2026.0.0
+
+            Added the *allowStale* and *hintPolygon* parameters.
+
         .. note::
 
             This will return the closest hit point if multiple intersections are found.
 
         .. note::
 
-            To use the `Hit` functions the mesh must be unfrozen and both :meth:`NeedCollisionUpdate(True) <SculptObject.NeedCollisionUpdate>` and :meth:`UpdateCollision` should be called to initialize the collision data.
+            | To use the `Hit` functions the mesh must be unfrozen and both :meth:`NeedCollisionUpdate(True) <SculptObject.NeedCollisionUpdate>` and :meth:`UpdateCollision` should be called to initialize the collision data.
+            | Once initialized, collision data freed by the document memory budget (see :func:`SetSculptMemoryBudget`) is rebuilt automatically before the hit test.
 
         :type bd: c4d.BaseDraw
         :param bd: The :class:`BaseDraw <c4d.BaseDraw>` that the user is casting the ray from.
@@ -333,6 +888,18 @@ class SculptObject(BaseObject):
         :param my: The Y coordinate (i.e mouse coordinate) in screen space.
         :type backfaces: bool
         :param backfaces: Allow back facing polygons to be hit tested.
+        :type allowStale: bool
+        :param allowStale:
+
+            | If a rebuild started by :meth:`UpdateCollisionAsync` is still running, pass **True** to test against the previous collision data instead of waiting for the rebuild.
+            | If there is no previous collision data, i.e. during the first build or after it was freed by the document memory budget, the call waits for the rebuild anyway.
+
+        :type hintPolygon: int
+        :param hintPolygon:
+
+            | The polygon returned by the previous hit, or `-1` for no hint.
+            | During a stroke consecutive rays hit close to each other, so the search starts around this polygon and only visits the rest of the object where a closer hit is still possible. The result is the same as without a hint.
+
         :rtype: dict{**distance**: float, **normal**: :class:`Vector <c4d.Vector>`, **point**: :class:`Vector <c4d.Vector>`, **polygon**: int}
         :return: The intersection data will be returned if the object was hit:
 
@@ -342,17 +909,22 @@ class SculptObject(BaseObject):
             polygon: The polygon that was hit.
         """
 
-    def HitObject(self, rayp, rayv, backfaces):
+    def HitObject(self, rayp, rayv, backfaces, allowStale=False, hintPolygon=-1):
         """
         Given a ray in object space do a hit intersection against the sculpt object and return any data if the ray hits the object.
 
+        .. versionchanged:: 2026.0.0
+
+            Added the *allowStale* and *hintPolygon* parameters.
+
         .. note::
 
             This will return the closest hit point if multiple intersections are found.
 
         .. note::
 
-            To use the `Hit` functions the mesh must be unfrozen and both :meth:`NeedCollisionUpdate(True) <SculptObject.NeedCollisionUpdate>` and :meth:`UpdateCollision` should be called to initialize the collision data.
+            | To use the `Hit` functions the mesh must be unfrozen and both :meth:`NeedCollisionUpdate(True) <SculptObject.NeedCollisionUpdate>` and :meth:`UpdateCollision` should be called to initialize the collision data.
+            | Once initialized, collision data freed by the document memory budget (see :func:`SetSculptMemoryBudget`) is rebuilt automatically before the hit test.
 
         :type rayp: c4d.Vector
         :param rayp: The starting position of the ray in object space.
@@ -360,6 +932,18 @@ class SculptObject(BaseObject):
         :param rayv: The direction the ray is pointing.
         :type backfaces: bool
         :param backfaces: Allow back facing polygons to be hit tested.
+        :type allowStale: bool
+        :param allowStale:
+
+            | If a rebuild started by :meth:`UpdateCollisionAsync` is still running, pass **True** to test against the previous collision data instead of waiting for the rebuild.
+            | If there is no previous collision data, i.e. during the first build or after it was freed by the document memory budget, the call waits for the rebuild anyway.
+
+        :type hintPolygon: int
+        :param hintPolygon:
+
+            | The polygon returned by the previous hit, or `-1` for no hint.
+            | During a stroke consecutive rays hit close to each other, so the search starts around this polygon and only visits the rest of the object where a closer hit is still possible. The result is the same as without a hint.
+
         :rtype: dict{**distance**: float, **normal**: :class:`Vector <c4d.Vector>`, **point**: :class:`Vector <c4d.Vector>`, **polygon**: int}
         :return: The intersection data will be returned if the object was hit:
 
@@ -402,6 +986,73 @@ class SculptObject(BaseObject):
         :param respectMask: **True** to not smooth any masked out points, **False** to apply it to every point.
         """
 
+    def ComputeCurvature(self, gaussian=False):
+        """
+        | Computes the curvature at each point at the current subdivision level.
+        | The computation is split across all available threads and reuses the neighbor data of the sculpt object.
+
+        .. versionadded:: 2026.0.0
+
+        :type gaussian: bool
+        :param gaussian: **True** to compute the Gaussian curvature, **False** to compute the mean curvature.
+        :rtype: memoryview
+        :return: A read-only view of *float32* values, one per point. The mean curvature is positive on convex areas and negative on concave ones.
+        """
+
+    def ComputeCavity(self, radius, samples=16):
+        """
+        | Computes how occluded each point is by the surface around it, within *radius*.
+        | The computation is split across all available threads and reuses the collision data of the sculpt object, see :meth:`UpdateCollision`.
+
+        .. versionadded:: 2026.0.0
+
+        :type radius: float
+        :param radius: The distance in object space up to which the surface is taken into account.
+        :type samples: int
+        :param samples: The number of rays cast from each point.
+        :rtype: memoryview
+        :return: A read-only view of *float32* values between 0 and 1, one per point. `0` means fully open, `1` fully occluded.
+        """
+
+    def ComputeThickness(self, maxDistance, samples=8):
+        """
+        | Computes the thickness of the object at each point by casting rays inwards, against the vertex normal.
+        | The computation is split across all available threads and reuses the collision data of the sculpt object, see :meth:`UpdateCollision`.
+
+        .. versionadded:: 2026.0.0
+
+        :type maxDistance: float
+        :param maxDistance: The maximum distance in object space a ray travels.
+        :type samples: int
+        :param samples: The number of rays cast from each point in a cone around the inverted normal.
+        :rtype: memoryview
+        :return: A read-only view of *float32* values, one per point. Points where no ray hit the surface are set to *maxDistance*.
+        """
+
+    def ComputeGeodesicDistance(self, sources, method=0):
+        """
+        | Computes the distance along the surface from the closest of the *sources* points to every point at the current subdivision level.
+        | Unlike the straight distance it does not bleed across thin features such as lips or fingers.
+
+        .. versionadded:: 2026.0.0
+
+        .. note::
+
+            | The heat method factorizes the mesh and caches the factorization for the current subdivision level, so further calls only cost two solves.
+            | The factorization depends on the point positions, through the cotangent weights and the time step taken from the mean edge length. It is rebuilt on the next call after the points changed, i.e. after any :meth:`Update` or change of subdivision level, so the distances always match the current shape.
+
+        :type sources: list of int
+        :param sources: The indices of the points the distance is measured from.
+        :type method: int
+        :param method: The method used:
+
+            | *SCULPTGEODESIC_HEAT*: The heat method. Default.
+            | *SCULPTGEODESIC_FASTMARCHING*: Multithreaded fast marching. Slower, but needs no factorization.
+
+        :rtype: memoryview
+        :return: A read-only view of *float32* distances in object space, one per point.
+        """
+
     def GetMaskCachePoint(self, id):
         """
         Gets the mask value from the mask cache.
@@ -415,14 +1066,38 @@ class SculptObject(BaseObject):
         :return: The mask cache value.
         """
 
-    def UpdateMask(self, fullUpdate):
+    def GetMaskCache(self):
+        """
+        Gets read-only access to the whole mask cache.
+
+        .. versionadded:: 2026.0.0
+
+        .. note::
+
+            | The view keeps its data alive. When :meth:`UpdateMask` or a change of subdivision level updates the mask cache, views that are still referenced keep the previous values.
+            | Call :meth:`GetMaskCache` again to read the current values.
+
+        :rtype: memoryview
+        :return: A read-only view of *float32* mask values, one per point at the current subdivision level.
+        """
+
+    def UpdateMask(self, fullUpdate, dirtyIndices=None):
         """
         Updates the mask on the sculpt object.
 
         .. versionadded:: R16.021
 
+        .. versionchanged:: 2026.0.0
+
+            Added the *dirtyIndices* parameter.
+
         :type fullUpdate: bool
         :param fullUpdate: Pass **True** to force a full update of the mask.
+        :type dirtyIndices: Optional[list of int]
+        :param dirtyIndices:
+
+            | The indices of the points whose mask changed, on any of the layers with an enabled mask.
+            | Only these points are recomputed in the mask cache. Ignored if *fullUpdate* is **True**.
         """
 
     def InitOpenGL(self, bd):
@@ -435,6 +1110,48 @@ class SculptObject(BaseObject):
         :param bd: The viewport that is being updated. If **None** then the currently active view will be used.
         """
 
+    def GetViewBuffer(self, bd):
+        """
+        | Gets the point ID and depth buffer of the sculpt object for the viewport *bd*.
+        | The buffer is rendered on the CPU across all available threads and cached until the camera of *bd* or the sculpt object changes.
+        | The fill draw modes can use it to find the visible points inside the lasso, polygon or rectangle, see :meth:`SculptBrushParams.EnableFillToolViewBuffer`.
+
+        .. versionadded:: 2026.0.0
+
+        .. note::
+
+            | Several points can fall in the same pixel on dense meshes, so *pointIds* only holds one of them and does not list all the visible points.
+            | To know if a point is visible, project it and compare its depth with *depth* at its pixel.
+
+        .. note::
+
+            The returned views keep their data alive. When the buffer is rebuilt, views that are still referenced keep the previous values.
+
+        :type bd: c4d.BaseDraw
+        :param bd: The viewport to get the buffer for. If **None** then the currently active view will be used.
+        :rtype: dict{**width**: int, **height**: int, **pointIds**: memoryview, **depth**: memoryview}
+        :return: The buffer, row by row from the top left pixel:
+
+            width: The width of the buffer in pixels.
+            height: The height of the buffer in pixels.
+            pointIds: A read-only view of *int32* values, the index of one visible point in each pixel, or `-1` if no point is in the pixel.
+            depth: A read-only view of *float32* values, the camera space depth of each pixel.
+        """
+
+    def GetFacingFlags(self, bd):
+        """
+        | Gets which polygons of the sculpt object are facing the camera of the viewport *bd*.
+        | The flags are computed at once from the face normals (see :meth:`GetFaceNormal`) and cached until the camera of *bd* or the normals change.
+        | They are shared by :meth:`HitScreen` and :meth:`BrushDabData.IsPolygonBackface`.
+
+        .. versionadded:: 2026.0.0
+
+        :type bd: c4d.BaseDraw
+        :param bd: The viewport to get the flags for. If **None** then the currently active view will be used.
+        :rtype: memoryview
+        :return: A read-only view of *uint8* values, one per polygon: `1` if the polygon is facing the camera, otherwise `0`.
+        """
+
     def IsPointSelected(self, index):
         """
         | For use in the :meth:`SculptBrushToolData.FloodSelectedLayer` method to determine if a point should be moved or not.
@@ -502,6 +1219,46 @@ class SculptObject(BaseObject):
         :return: The Polygon Object displayed in the viewport.
         """
 
+    def GetSymmetryMap(self, level, axis, tolerance=0.0):
+        """
+        | Gets the symmetry index map for the subdivision *level* and mirror *axis*.
+        | Each entry holds the index of the point that mirrors the point at the same index, so mirrored dabs can gather their points instead of doing a second spatial search.
+        | The map is built on the first call and cached on the sculpt object until the topology changes or :meth:`ClearSymmetryMaps` is called.
+        | Maps are cached per *level*, *axis* and *tolerance*: a call with another *tolerance* builds and caches a separate map, it never returns a map built with a different tolerance.
+
+        .. versionadded:: 2026.0.0
+
+        .. note::
+
+            | The points are matched topologically starting from the mirror plane, so small asymmetries in the mesh are tolerated.
+            | Points that could not be matched within *tolerance* are set to `-1`.
+
+        .. note::
+
+            The returned view keeps its data alive, even after :meth:`ClearSymmetryMaps` or a change of topology frees the cached map.
+
+        :type level: int
+        :param level: The subdivision level to get the map for.
+        :raise IndexError: If the *level* is out of range : *0<=level<=*:meth:`GetSubdivisionCount`.
+        :type axis: int
+        :param axis: The mirror axis in object space: `0` for X, `1` for Y, `2` for Z.
+        :type tolerance: float
+        :param tolerance: The maximum distance in object space between a mirrored point and its match. Pass `0.0` to let the sculpt object choose one from the average edge length, this is the map used by the sculpt brushes.
+        :rtype: memoryview
+        :return: A read-only view of *int32* point indices, one per point at *level*.
+        """
+
+    def ClearSymmetryMaps(self):
+        """
+        Frees all the symmetry index maps cached by :meth:`GetSymmetryMap`.
+
+        .. versionadded:: 2026.0.0
+
+        .. note::
+
+            The views already returned by :meth:`GetSymmetryMap` stay valid, their data is freed once they are no longer referenced.
+        """
+
 
 class SculptModifierInterface(object):
     """
@@ -517,16 +1274,33 @@ class SculptModifierInterface(object):
         """
         Initializes the interface so that you can apply modifiers to the given Polygon Object.
 
+        .. versionchanged:: 2026.0.0
+
+            Reuses the internal data when the topology of *poly* did not change.
+
+        .. note::
+
+            | The interface keeps a topology key of the Polygon Object it was last initialized with: its point count, its polygon count and a hash of its polygon indices, the same hash as :meth:`SculptObject.GetTopologyHash`.
+            | If *poly* has the same key, only the point positions are refreshed and the internal data is reused, otherwise the internal data is rebuilt.
+            | When *poly* is the same object as last time and its **DIRTYFLAGS_DATA** count did not change, the key is not computed again. In all other cases it is computed from *poly*, so a deformer that gets a new Polygon Object on every evaluation still reuses the data as long as the input topology does not change.
+
         :type poly: c4d.PolygonObject
         :param poly: The Polygon Object that you wish to apply modifiers to.
         :rtype: bool
         :return: **True** if successfully initialized.
         """
 
-    def Clear(self):
+    def Clear(self, release=True):
         """
         | Clears the interface.
         | This will free up any internal data that was required to apply modifiers to the initialized :class:`PolygonObject <c4d.PolygonObject>` in :meth:`Init`.
+
+        .. versionchanged:: 2026.0.0
+
+            Added the *release* parameter.
+
+        :type release: bool
+        :param release: **True** to free the internal data, **False** to keep it so that a later call to :meth:`Init` with the same topology can reuse it.
         """
 
     def GetDefaultData(self):
@@ -729,6 +1503,29 @@ class SculptLayerData(BaseList2D):
         :param mask: The amount to add to the existing mask.
         """
 
+    def SetAllMasks(self, masks, low=0.0, high=1.0):
+        """
+        | Set the mask of all the points at once.
+        | The values are remapped from the *low* to *high* range to 0 to 1, then clamped between 0 and 1.
+        | The views returned by :meth:`SculptObject.ComputeCurvature`, :meth:`SculptObject.ComputeCavity` and :meth:`SculptObject.ComputeThickness` can be used as *masks*, only reading them. Pass their range of interest in *low* and *high*.
+
+        .. versionadded:: 2026.0.0
+
+        .. code-block:: python
+
+            # Masks the concave areas, fully where the mean curvature reaches -1.
+            layerData.SetAllMasks(sculptObject.ComputeCurvature(), 0.0, -1.0)
+
+        :type masks: Union[memoryview, list of float]
+        :param masks: The mask values, one per point. A memoryview must hold *float32* values.
+        :raise ValueError: If the number of values is not :meth:`GetPointCount`.
+        :type low: float
+        :param low: The value that is mapped to a mask of 0.
+        :type high: float
+        :param high: The value that is mapped to a mask of 1. It can be lower than *low* to invert the mask.
+        :raise ValueError: If *low* and *high* are equal.
+        """
+
     def HasMask(self):
         """
         Check if this Layer has a mask applied to it.
@@ -807,6 +1604,205 @@ class SculptLayerData(BaseList2D):
         :raise IndexError: If the point *index* is out of range : *0<=index<*:meth:`GetPointCount`.
         """
 
+    def GetModifiedPoints(self):
+        """
+        | Gets the points of this layer whose offset was modified since the last call to :meth:`ClearModifiedPoints`.
+        | The bits are packed the same way as in :meth:`BrushDabData.GetStrokeModifiedPoints`.
+
+        .. versionadded:: 2026.0.0
+
+        .. note::
+
+            | The bits are set by every write to the offsets of this layer: :meth:`SetOffset`, :meth:`AddOffset`, :meth:`ParallelApply`, :meth:`Load`, :meth:`ClearLayer`, a :meth:`Resample` into this layer, :meth:`SculptObject.Smooth` and the sculpt brushes.
+            | Writes to the mask do not set them.
+
+        :rtype: memoryview
+        :return: A read-only view of *uint8* values, packing one bit per point of the layer.
+        """
+
+    def GetModifiedStats(self):
+        """
+        Gets statistics about the points of this layer that were modified since the last call to :meth:`ClearModifiedPoints`.
+
+        .. versionadded:: 2026.0.0
+
+        :rtype: dict{**count**: int, **min**: :class:`Vector <c4d.Vector>`, **max**: :class:`Vector <c4d.Vector>`, **maxDisplacement**: float}
+        :return: The statistics:
+
+            count: The number of modified points.
+            min: The minimum corner of the bounding box of the modified points, in object space. :class:`c4d.Vector(0,0,0) <c4d.Vector>` if *count* is `0`.
+            max: The maximum corner of the bounding box of the modified points, in object space. :class:`c4d.Vector(0,0,0) <c4d.Vector>` if *count* is `0`.
+            maxDisplacement: The length of the largest single change of offset made by one write, see :meth:`GetModifiedPoints`. It is not measured from the offsets at the last :meth:`ClearModifiedPoints`, no copy of them is kept. `0.0` if *count* is `0`.
+        """
+
+    def ClearModifiedPoints(self):
+        """
+        Clears the modified points and statistics of this layer. Call this once the downstream systems have processed the changes.
+
+        .. versionadded:: 2026.0.0
+        """
+
+    def ParallelApply(self, func, chunkSize=4096, mask=False, add=True):
+        """
+        | Writes to the points of this layer from multiple threads, range by range, with the values returned by *func*.
+        | Takes care of everything needed to safely write to the layer from multiple threads:
+
+        - The point data (or mask data if *mask* is **True**) is initialized first, see :meth:`InitializeAllPointData`.
+        - If called between :meth:`SculptObject.StartUndo` and :meth:`SculptObject.EndUndo` all the points are registered for undo at once.
+        - The values returned by *func* are written to the layer in native code, outside of the Python interpreter.
+        - :meth:`SculptObject.Update` is called once all the ranges are done.
+
+        .. versionadded:: 2026.0.0
+
+        .. note::
+
+            | If *func* raises, or returns a buffer of the wrong size, on any worker thread the ranges that are not started yet are cancelled and the running ones are finished.
+            | The ranges already written stay written: they are registered for undo, so :meth:`SculptObject.EndUndo` and an undo revert them, and :meth:`SculptObject.Update` is called for them.
+            | The first exception is then raised again in the calling thread.
+
+        .. code-block:: python
+
+            import numpy
+
+            normals = numpy.array(...)  # The vertex normals as an (n, 3) float32 array.
+
+            def Inflate(start, end):
+                return normals[start:end] * 0.1
+
+            layer.ParallelApply(Inflate)
+
+        .. warning::
+
+            | *func* is called from worker threads, but they hold the Python GIL while running it, so pure Python code in *func* runs one range at a time and gives no speedup.
+            | Only the work that releases the GIL, such as NumPy operations, and the writes to the layer run in parallel. Keep *func* vectorized and do not call :meth:`SetOffset`, :meth:`AddOffset`, :meth:`SetMask`, :meth:`AddToMask`, :meth:`TouchPointForUndo` or :meth:`TouchMaskForUndo` from it.
+
+        :type func: function(start, end)
+        :param func:
+
+            | Called for each range of point indices *start* (inclusive) to *end* (exclusive).
+            | Must return a buffer of *float32* values for the range: `3` per point (the offsets) or `1` per point if *mask* is **True**.
+
+        :type chunkSize: int
+        :param chunkSize: The number of points in each range.
+        :type mask: bool
+        :param mask: **True** if *func* returns mask values, **False** if it returns offsets.
+        :type add: bool
+        :param add: **True** to add the values to the layer like :meth:`AddOffset` and :meth:`AddToMask`, **False** to replace them like :meth:`SetOffset` and :meth:`SetMask`.
+        :raise ValueError: If a buffer returned by *func* does not have the expected size.
+        :raise Exception: The first exception raised by *func*.
+        :rtype: bool
+        :return: **True** once all the ranges were written.
+        """
+
+    def Resample(self, target, add=False):
+        """
+        | Transfers the offsets of this layer to the *target* layer data at another subdivision level.
+        | If *target* is at a higher level the offsets are carried up through the subdivision hierarchy.
+        | If *target* is at a lower level the offsets are fitted with least squares, so that subdividing the result matches this layer as closely as possible. The detail that cannot be represented at the lower level is lost.
+        | The work is split across all available threads.
+
+        .. versionadded:: 2026.0.0
+
+        .. code-block:: python
+
+            # Bakes the selected level 6 layer into the level 4 data of the Base Object layer.
+            layer = sculptObject.GetCurrentLayer()
+            if not isinstance(layer, c4d.modules.sculpting.SculptLayer) or layer.IsBaseLayer():
+                raise TypeError("Select a regular sculpt layer.")
+            source = layer.GetFirstSculptLayer()
+            base = sculptObject.GetBaseLayer().GetFirstSculptLayer()
+            while base is not None and base.GetSubdivisionLevel() != 4:
+                base = base.GetNext()
+            if base is not None and source.GetSubdivisionLevel() == 6 and source.Resample(base, True):
+                # The detail is now in the Base Object layer, clear the source so it is not applied twice.
+                source.ClearLayer()
+                sculptObject.Update()
+
+        .. note::
+
+            Be sure to call :meth:`SculptObject.Update` afterwards.
+
+        :type target: c4d.modules.sculpting.SculptLayerData
+        :param target: The layer data to write to. It must belong to the same :class:`SculptObject <c4d.modules.sculpting.SculptObject>`.
+        :raise ValueError: If *target* is at the same subdivision level or belongs to another sculpt object.
+        :type add: bool
+        :param add: **True** to add the offsets to the existing ones of *target*, **False** to replace them.
+        :rtype: bool
+        :return: **True** if the offsets were transferred, otherwise **False**.
+        """
+
+    def BakeDisplacement(self, filename, baseLevel, resolution, space, vector=False, callback=None):
+        """
+        | Bakes the offsets of this layer into displacement maps, relative to the surface at *baseLevel*.
+        | The maps are rasterized tile by tile across all available threads and each tile is written to disk as soon as it is done, so the full map is never held in memory.
+
+        .. versionadded:: 2026.0.0
+
+        .. note::
+
+            | The UVs are taken from the first :class:`UVWTag <c4d.UVWTag>` of the original object. If it has none, nothing is written and **False** is returned.
+            | One file is written per UV tile. Use the `<UDIM>` token in *filename* to name them, otherwise only the 0-1 tile is baked.
+
+        :type filename: str
+        :param filename: The path of the file(s) to write. The format is chosen from the extension.
+        :type baseLevel: int
+        :param baseLevel: The subdivision level the displacement is measured from.
+        :raise IndexError: If *baseLevel* is out of range : *0<=baseLevel<*:meth:`GetSubdivisionLevel`.
+        :type resolution: int
+        :param resolution: The width and height in pixels of each tile.
+        :type space: int
+        :param space: The space the vector displacement is expressed in: *SCULPTBAKESPACE_TANGENT* or *SCULPTBAKESPACE_OBJECT*. Ignored if *vector* is **False**, the displacement along the normal has no space.
+        :type vector: bool
+        :param vector: **True** to bake a vector displacement map, **False** to bake the displacement along the normal only.
+        :type callback: Optional[function(progress)]
+        :param callback:
+
+            | Called regularly from the main thread with the *progress* as a float between 0 and 1.
+            | Return **False** to cancel the bake, otherwise **True**.
+
+        :rtype: bool
+        :return: **True** if all the tiles were written, otherwise **False**, also if the original object has no :class:`UVWTag <c4d.UVWTag>`.
+        """
+
+    def Save(self, stream, precision=0):
+        """
+        | Writes the offsets and mask of this layer to *stream* in a compact binary format.
+        | Only the points that have an offset or a mask value are written.
+
+        .. versionadded:: 2026.0.0
+
+        :type stream: Union[str, io.BufferedIOBase]
+        :param stream: The path of the file to write, or a binary stream opened for writing.
+        :type precision: int
+        :param precision: How the offsets are stored:
+
+            | *SCULPTLAYERPRECISION_FLOAT32*: Full precision. Default.
+            | *SCULPTLAYERPRECISION_FLOAT16*: Half precision floats.
+            | *SCULPTLAYERPRECISION_QUANTIZED*: 16-bit integers scaled to the bounding box of the offsets.
+
+        :rtype: bool
+        :return: **True** if the layer was written, otherwise **False**.
+        """
+
+    def Load(self, stream):
+        """
+        | Reads the offsets and mask written by :meth:`Save` into this layer, replacing its current data.
+        | When *stream* is a path the file is memory-mapped instead of being read into memory first.
+
+        .. versionadded:: 2026.0.0
+
+        .. note::
+
+            | The layer must have the same point count as the layer that was saved.
+            | Be sure to call :meth:`SculptObject.Update` afterwards.
+
+        :type stream: Union[str, io.BufferedIOBase]
+        :param stream: The path of the file to read, or a binary stream opened for reading.
+        :raise ValueError: If the data is not a sculpt layer or its point count does not match :meth:`GetPointCount`.
+        :rtype: bool
+        :return: **True** if the layer was read, otherwise **False**.
+        """
+
 
 class SculptLayerBase(BaseObject):
     """
@@ -836,6 +1832,15 @@ class SculptLayerBase(BaseObject):
         """
         Set the visibility of this layer on the sculpt object.
 
+        .. versionchanged:: 2026.0.0
+
+            Supports incremental compositing, see :meth:`SculptObject.SetIncrementalComposite`.
+
+        .. note::
+
+            | When incremental compositing is enabled (see :meth:`SculptObject.SetIncrementalComposite`) only the change of this layer is applied to the composited points, instead of recompositing all the layers.
+            | For a :class:`SculptFolder <c4d.modules.sculpting.SculptFolder>` the change of each layer it contains is applied.
+
         :type state: bool
         :param state: The visibility state.
         """
@@ -856,6 +1861,16 @@ class SculptLayerBase(BaseObject):
         :param state: The locked state.
         """
 
+    def IsOffloaded(self):
+        """
+        Check if the data of the layer, or of all the layers in the folder, is currently offloaded to disk. See :meth:`SculptObject.SetLayerMemoryBudget`.
+
+        .. versionadded:: 2026.0.0
+
+        :rtype: bool
+        :return: **True** if offloaded, **False** if in memory.
+        """
+
     def GetStrength(self):
         """
         Get the currents strength of the layer.
@@ -868,6 +1883,15 @@ class SculptLayerBase(BaseObject):
         """
         Set the strength of the layer on the sculpt object.
 
+        .. versionchanged:: 2026.0.0
+
+            Supports incremental compositing, see :meth:`SculptObject.SetIncrementalComposite`.
+
+        .. note::
+
+            | When incremental compositing is enabled (see :meth:`SculptObject.SetIncrementalComposite`) only the change of this layer is applied to the composited points, i.e. the change of strength times its masked offsets.
+            | For a :class:`SculptFolder <c4d.modules.sculpting.SculptFolder>` the change of each layer it contains is applied.
+
         :type strength: float
         :param strength: The strength value to set.
         """
@@ -1019,6 +2043,26 @@ class SculptLayer(SculptLayerBase):
         :param mask: The value to add to the mask.
         """
 
+    def SetAllMasks(self, masks, low=0.0, high=1.0):
+        """
+        Set the mask of all the points at once. See :meth:`SculptLayerData.SetAllMasks`.
+
+        .. versionadded:: 2026.0.0
+
+        .. note::
+
+            This method will get the correct :class:`SculptLayerData <c4d.modules.sculpting.SculptLayerData>` for this layer and call the corresponding method for it.
+
+        :type masks: Union[memoryview, list of float]
+        :param masks: The mask values, one per point. A memoryview must hold *float32* values.
+        :raise ValueError: If the number of values is not :meth:`GetPointCount`.
+        :type low: float
+        :param low: The value that is mapped to a mask of 0.
+        :type high: float
+        :param high: The value that is mapped to a mask of 1. It can be lower than *low* to invert the mask.
+        :raise ValueError: If *low* and *high* are equal.
+        """
+
     def HasMask(self):
         """
         Check if this layer has a mask at the current subdivision level.
@@ -1133,14 +2177,41 @@ class SculptLayer(SculptLayerBase):
         """
         Set the mask enabled *state* for the current layer data at this current subdivision level.
 
+        .. versionchanged:: 2026.0.0
+
+            Supports incremental compositing, see :meth:`SculptObject.SetIncrementalComposite`.
+
         .. note::
 
             This method will get the correct :class:`SculptLayerData <c4d.modules.sculpting.SculptLayerData>` for this layer and call the corresponding method for it.
 
+        .. note::
+
+            When incremental compositing is enabled (see :meth:`SculptObject.SetIncrementalComposite`) only the change of this layer is applied to the composited points.
+
         :type state: bool
         :param state: The state of the mask.
         """
 
+    def Resample(self, target, add=False):
+        """
+        Transfers the offsets of this layer to the *target* layer data at another subdivision level. See :meth:`SculptLayerData.Resample`.
+
+        .. versionadded:: 2026.0.0
+
+        .. note::
+
+            This method will get the correct :class:`SculptLayerData <c4d.modules.sculpting.SculptLayerData>` for this layer and call the corresponding method for it.
+
+        :type target: c4d.modules.sculpting.SculptLayerData
+        :param target: The layer data to write to. It must belong to the same :class:`SculptObject <c4d.modules.sculpting.SculptObject>`.
+        :raise ValueError: If *target* is at the same subdivision level or belongs to another sculpt object.
+        :type add: bool
+        :param add: **True** to add the offsets to the existing ones of *target*, **False** to replace them.
+        :rtype: bool
+        :return: **True** if the offsets were transferred, otherwise **False**.
+        """
+
 
 class SculptFolder(SculptLayerBase):
     """
@@ -1321,6 +2392,26 @@ class SculptBrushParams(object):
             | Default is **True**.
         """
 
+    def EnableFillToolViewBuffer(self, enable):
+        """
+        | When this is enabled the Fill algorithm uses the :meth:`SculptObject.GetViewBuffer` instead of hit testing each screen space pixel.
+        | Every point is projected into the view and selected if it is inside the fill area and its depth is within a small tolerance of the buffer depth at its pixel.
+        | The point IDs of the buffer are only used to skip the empty areas, so all the points that share a pixel are selected and no isolated points are left.
+
+        .. versionadded:: 2026.0.0
+
+        .. warning::
+
+            | With the view buffer the points hidden behind other parts of the object are no longer selected.
+            | Enable it only for brushes that should fill the visible surface only.
+
+        :type enable: bool
+        :param enable:
+
+            | **True** if the brush should use the view buffer, **False** to hit test each pixel.
+            | Default is **False**.
+        """
+
     def EnablePressureHUD(self, enable):
         """
         When enabled will display the pressure value in the sculpting size/pressure HUD.
@@ -1642,6 +2733,25 @@ class BrushDabData(object):
         :return: **True** if it's a mirrored dab or **False** if it's the main brush stroke.
         """
 
+    def GetMirrorPointIndex(self, index):
+        """
+        | Gets the index of the point that mirrors the point at *index* for the current dab.
+        | This is a lookup into the :meth:`SculptObject.GetSymmetryMap` for the current level and symmetry plane, with the default tolerance, and is much faster than calling :meth:`GetMirrorPoint` and searching for the closest point.
+
+        .. versionadded:: 2026.0.0
+
+        .. note::
+
+            | The symmetry maps only exist for mirroring along an object space axis through the origin.
+            | When the brush uses world space, radial or any other symmetry this always returns `-1`. Use :meth:`GetMirrorPoint` instead.
+
+        :type index: int
+        :param index: The index of the point on the :class:`SculptObject <c4d.modules.sculpting.SculptObject>`.
+        :raise IndexError: If the point *index* is out of range : *0<=index<*:meth:`SculptObject.GetPointCount`.
+        :rtype: int
+        :return: The index of the mirrored point, or `-1` if the point has no match.
+        """
+
     def GetBrushOverride(self):
         """
         Gets the override flags. This could be any combination of the *OVERRIDE* flags.
@@ -1763,6 +2873,20 @@ class BrushDabData(object):
         :return: The final falloff value that can be used to adjust the offset value.
         """
 
+    def GetBrushFalloffs(self, customDistances=None):
+        """
+        | Same as :meth:`GetBrushFalloff` but for all the points of the dab at once.
+        | Pass the distances returned by :meth:`SculptObject.ComputeGeodesicDistance` as they are to get a falloff that follows the surface. The distance of each point of the dab is picked from them using its *pointIndex* (see :meth:`GetPointData`).
+
+        .. versionadded:: 2026.0.0
+
+        :type customDistances: Optional[Union[memoryview, list of float]]
+        :param customDistances: The custom distances to use, one per point of the :class:`SculptObject <c4d.modules.sculpting.SculptObject>` and indexed by point index, or **None** to use the actual distances from the hitpoint. A memoryview must hold *float32* values.
+        :raise ValueError: If the number of distances is not :meth:`SculptObject.GetPointCount`.
+        :rtype: memoryview
+        :return: A read-only view of *float32* falloff values, one per point data index.
+        """
+
     def GetBrushFalloffFromPos(self, pos):
         """
         Returns the falloff value, defined by the falloff curve, based on the distance from *pos* to the hitpoint for the dab.
@@ -1835,6 +2959,45 @@ class BrushDabData(object):
         :return: **True** if the point was modified, otherwise **False**.
         """
 
+    def GetStrokeModifiedPoints(self):
+        """
+        | Gets all the points modified so far by the current stroke, including its mirrored strokes.
+        | Bit *index* is set if the point at *index* was modified, the bits are in little endian order. Use ``numpy.unpackbits(numpy.frombuffer(view, numpy.uint8), bitorder="little")`` to unpack them.
+
+        .. versionadded:: 2026.0.0
+
+        .. note::
+
+            | The modified points and statistics are reset automatically when a stroke starts, or explicitly with :meth:`ClearStrokeModifiedPoints`.
+            | The returned view keeps its data alive, it is not changed by later dabs or resets.
+
+        :rtype: memoryview
+        :return: A read-only view of *uint8* values, packing one bit per point of the :class:`SculptObject <c4d.modules.sculpting.SculptObject>`.
+        """
+
+    def GetStrokeModifiedStats(self):
+        """
+        Gets statistics about the points modified so far by the current stroke.
+
+        .. versionadded:: 2026.0.0
+
+        :rtype: dict{**count**: int, **min**: :class:`Vector <c4d.Vector>`, **max**: :class:`Vector <c4d.Vector>`, **maxDisplacement**: float}
+        :return: The statistics:
+
+            count: The number of modified points.
+            min: The minimum corner of the bounding box of the modified points, in object space. :class:`c4d.Vector(0,0,0) <c4d.Vector>` if *count* is `0`.
+            max: The maximum corner of the bounding box of the modified points, in object space. :class:`c4d.Vector(0,0,0) <c4d.Vector>` if *count* is `0`.
+            maxDisplacement: The largest distance between a modified point and its position when the stroke started (see :meth:`GetOriginalPoint`). `0.0` if *count* is `0`.
+        """
+
+    def ClearStrokeModifiedPoints(self):
+        """
+        | Clears the modified points and statistics of the current stroke.
+        | Use this to only get the changes made since the last time the downstream systems processed them. It has no effect on :meth:`IsPointModified`.
+
+        .. versionadded:: 2026.0.0
+        """
+
     def GetStencilColor(self, point, mode=0):
         """
         Retrieves the grey value, color and coordinates of the stencil for a point in the Sculpt Object local space.
@@ -1924,3 +3087,20 @@ class BrushDabData(object):
         :rtype: bool
         :return: **True** if the dab is on backfacing polygons, otherwise **False**.
         """
+
+    def IsPolygonBackface(self, index):
+        """
+        Checks if the polygon at *index* is facing away from the camera of the viewport the dab is drawn in.
+
+        .. versionadded:: 2026.0.0
+
+        .. note::
+
+            This is a lookup into the :meth:`SculptObject.GetFacingFlags` of :meth:`GetBaseDraw`.
+
+        :type index: int
+        :param index: The index of the polygon on the :class:`SculptObject <c4d.modules.sculpting.SculptObject>`.
+        :raise IndexError: If the polygon *index* is out of range : *0<=index<*:meth:`SculptObject.GetPolygonCount`.
+        :rtype: bool
+        :return: **True** if the polygon is backfacing, otherwise **False**.
+        """